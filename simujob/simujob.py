@@ -27,14 +27,14 @@ will be expanded to
 ''
 #!/bin/bash
 #SBATCH --mail-type=NONE
-#SBATCH --array=1-5
+#SBATCH --array=1-4
 #SBATCH -e err/%A_%a.err
 #SBATCH -o out/%A_%a.out
 
-a=(0 1 2 1 2)
-b=(0 3 3 4 4)
-rfname = (0 "results/a-1-b-3" "results/a-2-b-3" "results/a-1-b-4" "results/a-2-b-4")
-runmyprogram -a ${a[${SGE_TASK_ID}]} -b ${b[${SGE_TASK_ID}]} -rfname ${rfname[${SGE_TASK_ID}]} -c 1 -d 2
+a=(0 1 1 2 2)
+b=(0 3 4 3 4)
+rfname="results/a-${a[${SLURM_ARRAY_TASK_ID}]}-b-${b[${SLURM_ARRAY_TASK_ID}]}.dat"
+runmyprogram -c 1  -d 2  -a ${a[${SLURM_ARRAY_TASK_ID}]}  -b ${b[${SLURM_ARRAY_TASK_ID}]}  -rfname ${rfname}
 ''
 
 note the additional argument rfname, that has not been specified. In order for this script together with
@@ -47,13 +47,98 @@ For more complicated output data, with an arbitrary number of dimensions, use ne
 
 """
 
-import itertools as it
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+import io
+import math
 import os
 from os import path
+import posixpath
+import re
+import shutil
 import subprocess
+import tempfile
 import xarray as xr
 import numpy as np
-from pandas import MultiIndex
+from pandas import MultiIndex, read_csv
+
+
+__all__ = ['MatrixJob', 'submit_many', 'ssh_command', 'close_ssh_connection',
+           'loadtxtfile', 'innerdims', 'defaultlaunchfiletemplate', 'netcdfengine']
+
+# h5netcdf opens small files considerably faster than the default netCDF4
+# library and does not serialize threaded reads on the HDF5 global lock; use
+# it when installed, otherwise let xarray pick its default engine.
+try:
+        import h5netcdf  # noqa: F401
+        netcdfengine = 'h5netcdf'
+except ImportError:
+        netcdfengine = None
+
+
+# One multiplexed ssh connection per remote, shared by all jobs (OpenSSH
+# ControlMaster). The first command to a remote opens a master connection that
+# stays alive in the background; all subsequent commands are tunneled through
+# it and skip the TCP + SSH handshake (hundreds of ms per call).
+_sshcontroldir = None
+
+def ssh_command(sshremote):
+        """ Returns the base ssh command (a list, to be extended with the remote
+            command) for sshremote, routed through a persistent shared master
+            connection.
+        """
+        global _sshcontroldir
+        if _sshcontroldir is None:
+                _sshcontroldir = tempfile.mkdtemp(prefix='simujob-ssh-')
+        return ['ssh',
+                '-o', 'ControlMaster=auto',
+                '-o', 'ControlPath={}/%r@%h-%p'.format(_sshcontroldir),
+                '-o', 'ControlPersist=600',
+                sshremote]
+
+def close_ssh_connection(sshremote):
+        """ Closes the persistent master connection to sshremote, if one exists.
+            Pending commands finish first; a new master is opened transparently
+            on the next command.
+        """
+        if _sshcontroldir is not None:
+                subprocess.call(ssh_command(sshremote)[:-1] + ['-O', 'exit', sshremote],
+                                stderr=subprocess.DEVNULL)
+
+def submit_many(jobs, submissioncmd='sbatch', extracmds=''):
+        """ Submits several jobs with a single ssh invocation per remote.
+
+            All submission commands are joined into one remote shell command,
+            so N submissions cost one ssh channel instead of N. The resulting
+            job ids are assigned to the jobid attribute of each job.
+
+            Args:
+                jobs (list): the MatrixJobs to submit. Their jobscripts are
+                             assumed to already exist on the cluster.
+        """
+        jobsbyremote = {}
+        for job in jobs:
+                jobsbyremote.setdefault(job.sshremote, []).append(job)
+        for sshremote, remotejobs in jobsbyremote.items():
+                # paths are deliberately unquoted, like everywhere else in this
+                # module, so remotepaths like '~/jobs/' still expand on the
+                # cluster side
+                cmds = '; '.join('cd {}; {} {} {}'.format(
+                                os.path.split(job.remotejobscriptname)[0],
+                                extracmds, submissioncmd,
+                                os.path.split(job.remotejobscriptname)[1])
+                        for job in remotejobs)
+                stdout = subprocess.check_output(
+                        ssh_command(sshremote) + ['source ~/.bash_profile; ' + cmds])
+                # pick the submission confirmations out of the output instead
+                # of taking the last N lines, since extracmds may print as well
+                idlines = re.findall(rb'Submitted batch job\s+(\d+)', stdout)
+                if len(idlines) != len(remotejobs):
+                        idlines = [line.split()[-1] for line in stdout.splitlines()
+                                   if line.split() and line.split()[-1].isdigit()]
+                for job, jobid in zip(remotejobs, idlines):
+                        job.jobid = int(jobid)
+                print(stdout)
 
 #####################################
 # System dependent default settings
@@ -75,6 +160,31 @@ python3 simulator.py {argstring}
 innerdims = ('i', 'observable_index')
 
 
+def _valuestrings(parvalues):
+        """ Converts a column of parameter values to strings. Columns that are
+            homogeneously int or float are converted in one vectorized numpy
+            pass (identical output to str(), but the loop runs in C); anything
+            else falls back to per-value str().
+        """
+        if parvalues and (all(type(v) is int for v in parvalues)
+                          or all(type(v) is float for v in parvalues)):
+                try:
+                        return np.asarray(parvalues, dtype=str).tolist()
+                except (OverflowError, ValueError):
+                        pass
+        return [str(v) for v in parvalues]
+
+
+def loadtxtfile(fname):
+        """ Reads a whitespace separated text result file into a numpy array,
+            squeezed like np.loadtxt would return it. pandas' C parser is used
+            instead of np.loadtxt, which tokenizes in pure python and is several
+            times slower on large result files.
+        """
+        return np.squeeze(read_csv(fname, sep=r'\s+', header=None, comment='#',
+                                   dtype=np.float64, engine='c').to_numpy())
+
+
 
 class MatrixJob(object):
         """
@@ -107,6 +217,11 @@ class MatrixJob(object):
             dependencies (list): A list of full paths to all files required by the simulation job,
                                 including the main executable.
 
+            resultfilesuffix (str): The extension of the result file names. For '.nc'
+                                retrieve_data opens the results lazily with
+                                xarray.open_mfdataset, anything else is read as
+                                whitespace separated text.
+
         Attributes:
             jobscriptname (str): The full path to the jobscript (submitted via qsub)
 
@@ -119,11 +234,11 @@ class MatrixJob(object):
                      remotepath ='',
                      sshremote='user@cluster.ch',
                      name ='a_short_but_descriptive_jobname',
-                     arrayargs={},
-                     zipargs={},
-                     constargs={},
+                     arrayargs=None,
+                     zipargs=None,
+                     constargs=None,
                      task_id_str='SLURM_ARRAY_TASK_ID',
-                     dependencies = [],
+                     dependencies = None,
                      launchfiletemplate = """
 #!/bin/bash
 #SBATCH --mail-type=NONE
@@ -134,203 +249,422 @@ class MatrixJob(object):
 {argdefstring}
 runmyprogram {argstring}
 """,
-                     fileargname = 'rfname' 
+                     fileargname = 'rfname',
+                     resultfilesuffix = '.dat'
         ):
         
             self.sshremote=sshremote
             self.task_id_str= task_id_str
-            self.localpath =localpath 
-            self.remotepath =remotepath 
+            # normalize the paths to a trailing separator, so the string
+            # concatenations building file names below do not silently depend
+            # on the caller passing one (the remote side is always posix)
+            self.localpath = os.path.join(localpath, '') if localpath else localpath
+            self.remotepath = posixpath.join(remotepath, '') if remotepath else remotepath
             self.name = name
-            self.arrayargs = arrayargs
-            self.zipargs = zipargs 
-            self.constargs = constargs
-            self.dependencies = dependencies
+            # the mutable defaults are created per instance (a shared default
+            # dict would alias the parameters of independent jobs)
+            self.arrayargs = arrayargs if arrayargs is not None else {}
+            self.zipargs = zipargs if zipargs is not None else {}
+            self.constargs = constargs if constargs is not None else {}
+            self.dependencies = dependencies if dependencies is not None else []
             #if folder is specified instead of local and remote path, set both to folder. (for backwards compatibility)
             if not folder == '':
-                            self.localpath=folder
-                            self.remotepath=folder
+                            self.localpath = os.path.join(folder, '')
+                            self.remotepath = posixpath.join(folder, '')
             # create flat lists over all combinations of arrayargs:
             self.launchfiletemplate = launchfiletemplate
             self.fileargname = fileargname
-
-            flatlists = list(zip(*it.product(*self.arrayargs.values())))
-            self.parvalues=flatlists
-
-            if not zipargs == {}:
-                    l=list(self.arrayargs.values()) +[list(zip(*self.zipargs.values()))]
-                    l2 =list(it.product(*l))
-                    l3=[ l[:-1]+l[-1] for l in l2 ]
-                    self.parvalues = list(zip ( * l3))
-
-            parnames = list(self.arrayargs.keys())+list(self.zipargs.keys())
-        
-
-            #recombine the lists with their name to a dictionary
-            self.arrayargsflat = { parname:parval for parname, parval in zip(parnames, self.parvalues) } 
-            # to create the resultfilenamelist: tranpose the flat arrayargs dict:
-            self.arrayargsflattr = [dict(zip(self.arrayargsflat.keys(), partuple))
-                                        for partuple in zip(*self.arrayargsflat.values())]
-            # concatenate to filenames and sort alphabetically to be reproducible
-            rfnames = ['"results/'+'-'.join(
-                                [parname+'-'+str(parvalue)
-                                        for parname, parvalue in sorted(pardict.items())]
-                                                        )   + '.dat"' 
-                                                                    for pardict in self.arrayargsflattr]
+            self.resultfilesuffix = resultfilesuffix
+
+            # the cartesian product over all combinations is never materialized:
+            # only the value pools are kept, single combinations are decoded
+            # from their index on demand by _combo (odometer arithmetic).
+            # the zipped parameters enter the product as one pool of tuples.
+            self._pools = [list(v) for v in self.arrayargs.values()]
+            if not self.zipargs == {}:
+                    self._pools.append(list(zip(*self.zipargs.values())))
+            self._sizes = [len(p) for p in self._pools]
+            self.n_combos = math.prod(self._sizes) if self._pools else 0
+            self._parnames = list(self.arrayargs.keys())+list(self.zipargs.keys())
+            # the alphabetical parameter order shows up in every file name and
+            # every retrieve; sort once here instead of once per use
+            self._sortedparnames = sorted(self._parnames)
 
             self.localjobscriptname = self.localpath + self.name + '.sh'
             self.remotejobscriptname = self.remotepath + self.name + '.sh'
-            self.arrayargsflat[self.fileargname]=rfnames         
             return
+
+        def _combo(self, i):
+            """ Decodes combination number i into the flat tuple of parameter
+                values (one value per parameter, zipped parameters unpacked),
+                in the same row major order itertools.product would yield.
+            """
+            vals = []
+            for pool, size in zip(reversed(self._pools), reversed(self._sizes)):
+                    i, j = divmod(i, size)
+                    vals.append(pool[j])
+            vals.reverse()
+            if not self.zipargs == {}:
+                    return tuple(vals[:-1]) + tuple(vals[-1])
+            return tuple(vals)
+
+        @property
+        def parvalues(self):
+            """ The flattened parameter values, one list per parameter, covering
+                all combinations (materialized on access).
+            """
+            return [list(parvalues) for parname, parvalues in self._argcolumns()]
+
+        @cached_property
+        def rfnames(self):
+            """ The result file names, one per parameter combination, with the
+                parameters sorted alphabetically to be reproducible.
+                Built (and cached) on first access; use get_rfname for a single
+                combination.
+            """
+            if self.n_combos == 0:
+                    return []
+            # decode all combination numbers at once, turn each parameter pool
+            # into a string column indexed by its odometer digit, and
+            # concatenate the columns (in alphabetical parameter order) with
+            # vectorized numpy string ops instead of a per-combination loop.
+            idx = np.unravel_index(np.arange(self.n_combos), self._sizes)
+            cols = {}
+            for j, parname in enumerate(self._parnames):
+                    if j < len(self.arrayargs):
+                            pool = np.array([str(v) for v in self._pools[j]])
+                            cols[parname] = pool[idx[j]]
+                    else:
+                            # zipped parameters all live in the last pool of tuples
+                            pool = np.array([str(t[j-len(self.arrayargs)]) for t in self._pools[-1]])
+                            cols[parname] = pool[idx[-1]]
+
+            rfnames = None
+            for k, parname in enumerate(self._sortedparnames):
+                    piece = np.char.add(('' if k == 0 else '-') + parname + '-', cols[parname])
+                    rfnames = piece if rfnames is None else np.char.add(rfnames, piece)
+            rfnames = np.char.add(np.char.add('"results/', rfnames), self.resultfilesuffix + '"')
+            return rfnames.tolist()
+
+        def get_rfname(self, i):
+            """ Returns the result file name of combination i alone, without
+                building (or caching) the full rfnames list.
+            """
+            pardict = dict(zip(self._parnames, self._combo(i)))
+            return ('"results/'
+                    + '-'.join(f'{parname}-{pardict[parname]}' for parname in self._sortedparnames)
+                    + self.resultfilesuffix + '"')
+
+        def __len__(self):
+            """ The number of parameter combinations (= array tasks). """
+            return self.n_combos
+
+        def _argcolumns(self):
+            """ Yields (parname, parvalues) pairs, one parameter at a time, with
+                the values covering all combinations. Only one column is alive
+                at a time, each computed from its pool by odometer indexing.
+            """
+            if self.n_combos == 0:
+                    for parname in self._parnames:
+                            yield parname, []
+                    return
+            idx = np.unravel_index(np.arange(self.n_combos), self._sizes)
+            for j, parname in enumerate(self._parnames):
+                    if j < len(self.arrayargs):
+                            pool = self._pools[j]
+                            yield parname, [pool[k] for k in idx[j]]
+                    else:
+                            pool = self._pools[-1]
+                            yield parname, [pool[k][j-len(self.arrayargs)] for k in idx[-1]]
+
+        @property
+        def arrayargsflat(self):
+            """ A dictionary {parname: [value for each combination, ...], ...}.
+                The result file names are not part of it; they live in rfnames.
+            """
+            return dict(self._argcolumns())
                 
             
 
         def rsync_here2there(self):
-                subprocess.call(['ssh', self.sshremote, 'mkdir -p {}'.format(self.remotepath)])
-                subprocess.call(['rsync', '-av',self.localpath ,self.sshremote+':'+self.remotepath])
- 
+                subprocess.call(ssh_command(self.sshremote) + ['mkdir -p {}'.format(self.remotepath)])
+                subprocess.call(['rsync', '-avz', '--whole-file', '-e', self._rsync_ssh(),
+                                 self.localpath ,self.sshremote+':'+self.remotepath])
+
         def rsync_there2here(self):
-                subprocess.call(['rsync', '-av', self.sshremote+':'+self.remotepath,self.localpath])
+                subprocess.call(['rsync', '-avz', '--whole-file', '-e', self._rsync_ssh(),
+                                 self.sshremote+':'+self.remotepath,self.localpath])
+
+        def _rsync_ssh(self):
+                # the remote shell for rsync: the multiplexed ssh command
+                # without the trailing remote (rsync appends it itself)
+                return ' '.join(ssh_command(self.sshremote)[:-1])
+
+        def tar_here2there(self):
+                """ Copies the local job folder to the cluster through a single
+                    compressed tar stream. Faster than rsync for directories of
+                    very many small files, at the price of always re-sending
+                    everything.
+                """
+                subprocess.call(ssh_command(self.sshremote) + ['mkdir -p {}'.format(self.remotepath)])
+                tar = subprocess.Popen(['tar', '-C', self.localpath, '-cz', '.'],
+                                       stdout=subprocess.PIPE)
+                subprocess.check_call(ssh_command(self.sshremote) + ['tar -xz -C {}'.format(self.remotepath)],
+                                      stdin=tar.stdout)
+                tar.stdout.close()
+                tar.wait()
 
         def submit(self, submissioncmd='sbatch', extracmds=''):
-                path, fname = os.path.split(self.remotejobscriptname)
-                stdout = subprocess.check_output(
-                        ['ssh',self.sshremote, 'source ~/.bash_profile; cd {}; {} {} {}'.format(
-                                path, extracmds,submissioncmd, fname
-                        )])
-
-                self.jobid=int(stdout.split()[-1])
-                print(stdout)
+                submit_many([self], submissioncmd=submissioncmd, extracmds=extracmds)
 
         def get_status(self, byname= False):
                 jobidentifier = self.name if byname else self.jobid
                 stdout = subprocess.check_output(
-                        ['ssh',self.sshremote, 'squeue | grep {} | wc -l'.format(
+                        ssh_command(self.sshremote) + ['squeue | grep {} | wc -l'.format(
                                 jobidentifier
                         )])
                 print("{} out of {} jobs still running".format(
                         int(stdout),
-                        len(self.parvalues[0])))
+                        self.n_combos))
 
         def delete_errors(self):
-                subprocess.check_output(['ssh', self.sshremote, 'rm {}err/*.err'.format(self.remotepath)])
+                subprocess.check_output(ssh_command(self.sshremote) + ['rm {}err/*.err'.format(self.remotepath)])
                 
 
         def print_errors(self):
-                stdout = subprocess.check_output(['ssh', self.sshremote, 'cat {}err/*.err'.format(self.remotepath)])
+                stdout = subprocess.check_output(ssh_command(self.sshremote) + ['cat {}err/*.err'.format(self.remotepath)])
                 print(str(stdout).replace('\\n', '\n'))
         def delete_stdout(self):
-                subprocess.check_output(['ssh', self.sshremote, 'rm {}out/*.out'.format(self.remotepath)])
+                subprocess.check_output(ssh_command(self.sshremote) + ['rm {}out/*.out'.format(self.remotepath)])
 
         def print_stdout(self):
-                stdout = subprocess.check_output(['ssh', self.sshremote, 'cat {}out/*.out'.format(self.remotepath)])
+                stdout = subprocess.check_output(ssh_command(self.sshremote) + ['cat {}out/*.out'.format(self.remotepath)])
                 print(str(stdout).replace('\\n', '\n'))
 
 
         
 
-        def create_all_files(self):
+        def create_all_files(self, use_system_cp=False):
             """ Creates the jobfile, jobdirectory and subdirectories if necessary and copys all other
                 files, that a job debends on.
+
+                Args:
+                    use_system_cp (bool): copy the dependencies with a single cp
+                                          invocation instead of shutil (keeps
+                                          reflinks on filesystems supporting them).
             """
             for f in [self.localpath, self.localpath+"err/", self.localpath+"out/", self.localpath+"results/"]:
                 os.makedirs(f, exist_ok = True)
-    
-            for dep in self.dependencies:
-                os.system("cp "+dep+" "+self.localpath)
+
+            if use_system_cp and self.dependencies:
+                subprocess.run(['cp', '-t', self.localpath] + list(self.dependencies), check=True)
+            else:
+                for dep in self.dependencies:
+                    shutil.copy2(dep, self.localpath)
 
             self.create_launch_file()
             
             return
 
-        def create_launch_file_content(self):
-            """ Creates the launch file to be submitted to SGE
-                uses the global string launchfiletemplate as a basis
+        def _write_launch_file_content(self, f):
+            """ Writes the launch file content to the file object f.
+
+                Writes a block of the form
+                 arg1=(0 a1v1 a1v2 a1v3)
+                 arg2=(0 a2v1 a2v2)
+                 ...
+                in place of {argdefstring}, one line per parameter, streamed
+                column by column so the block (which grows with the number of
+                combinations) never lives in memory as one string.
+                The zero after the paranthesis is a hack: bash array indexing
+                starts with zero, but sge_task_id with one.
             """
-            # create a string of the form
-            #"""
-            # arg1 = (0 a1v1 a1v2 a1v3 )
-            # arg2 = (0 a2v1 a2v2)
-            # ...
-            # """ 
-            # out of the arrayargsflat dict {'arg1':[a1v1,a1v2, a1v3], 'arg2':[a2v1,a2v2], ...}
-            # the zero after the paranthesis is a hack: bash array indexing starts with zero, but sge_task_id with one
-            argdefstring = "\n".join(
-                        [("{}=(0 "+ ("{} "*len(parvalues)) +")").format(parname,*parvalues)  
-                                    for parname,parvalues in self.arrayargsflat.items()])
-            
             # create the string
             #  -arg1 ${arg1[${SGE_TASK_ID}] }
-            arrayargstring = " ".join([" -{} ${{{}[${{{}}}]}}".format(key, key, self.task_id_str)
-                                                        for key in self.arrayargsflat.keys()])
-            constargstring = " ".join( ["-{} {} ".format(name,value) 
+            tid = self.task_id_str
+            arrayargstring = " ".join([f" -{key} ${{{key}[${{{tid}}}]}}"
+                                                        for key in self._parnames]
+                                    + [f" -{self.fileargname} ${{{self.fileargname}}}"])
+            constargstring = " ".join( [f"-{name} {value} "
                                                     for name, value in self.constargs.items() ])
 
-            launchfilecontent = self.launchfiletemplate.format(
-                                    nmax = len(next(iter(self.arrayargsflat.values()))),
-                                    argdefstring =  argdefstring,
-                                    argstring = constargstring + arrayargstring
-                                        )
+            head, _, tail = self.launchfiletemplate.partition('{argdefstring}')
+            f.write(head.format(nmax = self.n_combos,
+                                argstring = constargstring + arrayargstring))
+            for n, (parname, parvalues) in enumerate(self._argcolumns()):
+                    if n > 0:
+                            f.write("\n")
+                    f.write(f"{parname}=(0 ")
+                    f.write(" ".join(_valuestrings(parvalues)))
+                    f.write(")")
+            # the result file name is assembled by bash from the parameter
+            # arrays at task runtime, instead of embedding one precomputed name
+            # per combination -- the same name the rfnames property yields
+            if self._parnames:
+                    f.write("\n")
+            f.write('{}="results/{}{}"'.format(self.fileargname,
+                        '-'.join(f'{parname}-${{{parname}[${{{tid}}}]}}'
+                                for parname in self._sortedparnames),
+                        self.resultfilesuffix))
+            f.write(tail.format(nmax = self.n_combos,
+                                argstring = constargstring + arrayargstring))
 
-            return launchfilecontent
+        def create_launch_file_content(self):
+            """ Returns the content of the launch file as one string,
+                using the launchfiletemplate attribute as a basis
+                (create_launch_file streams the same content to disk directly).
+            """
+            buffer = io.StringIO()
+            self._write_launch_file_content(buffer)
+            return buffer.getvalue()
 
         def create_launch_file(self):
-            launchfilecontent = self.create_launch_file_content()
-            with open(self.localjobscriptname, "w") as f:
-                    f.write(launchfilecontent)
-                    f.close()
-            return 
+            with open(self.localjobscriptname, "w", buffering=1<<20) as f:
+                    self._write_launch_file_content(f)
+            return
 
 
     
-        def retrieve_data(self):
+        def retrieve_data(self, lazy=False, max_workers=None, chunks=None):
             """ returns the data generated by the matrix job, combined into an xarray
 
-            
+
+                Args:
+                    lazy (bool):    if True, wrap the file reads in dask.delayed
+                                    (requires dask) instead of loading eagerly,
+                                    so files are only read once (and where) the
+                                    data is actually accessed, in parallel.
+
+                    max_workers (int): the number of threads reading result files
+                                    concurrently (eager loading only). Defaults
+                                    to one per file, capped at 32.
+
+                    chunks:         optional dask chunk specification. If given,
+                                    the returned DataArray is dask backed
+                                    (requires dask), so downstream operations
+                                    run lazily, in parallel and can spill.
+
                 Returns:
                     data (DataArray):   an xarray.DataArray containing one dataarray
-                                        with coordinates specified by arrayargs and attributes 
-                                        specified by  constargs. The inner dimensions are named 
-                                        with the names specifyed in the variable innerdims (for txt data). 
+                                        with coordinates specified by arrayargs and attributes
+                                        specified by  constargs. The inner dimensions are named
+                                        with the names specifyed in the variable innerdims (for txt data).
             """
-            
+
+            allfiles = [(self.localpath+fname.strip('"'))
+                        for fname in self.rfnames ]
+            if max_workers is None:
+                max_workers = min(32, len(allfiles)) or 1
+            if self.resultfilesuffix == '.nc':
+                # netcdf results are opened lazily (dask backed) in one go;
+                # metadata fetches run in parallel, data is only read where
+                # the user actually accesses it
+                xrdata = xr.open_mfdataset(allfiles, combine='nested', concat_dim='pars',
+                                           parallel=True, engine=netcdfengine,
+                                           chunks=chunks if chunks is not None else {})
+                return self._unstack_pars(xrdata)
             try:
-                data = [np.loadtxt(self.localpath+fname.strip('"')) 
-                                for fname in self.arrayargsflat[self.fileargname] ]
-                xrdata = xr.DataArray(np.array(data), dims=('pars', *innerdims), attrs=self.constargs)
-            except:
-                data = [xr.open_dataset(self.localpath+fname.strip('"')) 
-                                for fname in self.arrayargsflat[self.fileargname] ]
-                xrdata = xr.concat(data, dim='pars')
+                if lazy:
+                    import dask
+                    import dask.array as da
+                    # the inner shape is read off the first file, all files are
+                    # assumed to share it
+                    innershape = loadtxtfile(allfiles[0]).shape
+                    data = da.stack([da.from_delayed(dask.delayed(loadtxtfile)(f),
+                                            shape=innershape, dtype=float)
+                                        for f in allfiles])
+                    xrdata = xr.DataArray(data, dims=('pars', *innerdims), attrs=self.constargs)
+                else:
+                    # preallocate the stacked array (shape read off the first
+                    # file) and let the readers fill their slice directly, so
+                    # the data is never held twice. the file reads are IO bound
+                    # and release the GIL, so they overlap nicely in a thread
+                    # pool (crucial on NFS mounts)
+                    first = loadtxtfile(allfiles[0])
+                    data = np.empty((len(allfiles), *first.shape), dtype=first.dtype)
+                    data[0] = first
+                    def load_into(i):
+                        data[i] = loadtxtfile(allfiles[i])
+                    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                        list(ex.map(load_into, range(1, len(allfiles))))
+                    xrdata = xr.DataArray(data, dims=('pars', *innerdims), attrs=self.constargs)
+                    if chunks is not None:
+                        # chunk via xarray so dicts keyed by dimension name
+                        # (like {'pars': 32}) work the same as on the .nc path
+                        xrdata = xrdata.chunk(chunks)
+            except (ValueError, OSError, UnicodeDecodeError):
+                # the files do not parse as whitespace separated text, so they
+                # are presumably netcdf; anything else (bugs, missing dask for
+                # lazy=True, KeyboardInterrupt) propagates instead of silently
+                # triggering a second full read of every file
+                try:
+                    xrdata = xr.open_mfdataset(allfiles, combine='nested', concat_dim='pars',
+                                               parallel=True, chunks={}, engine=netcdfengine)
+                except ImportError:
+                    # without dask installed, open eagerly (thread pooled) and concat
+                    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                        data = list(ex.map(partial(xr.open_dataset, engine=netcdfengine), allfiles))
+                    xrdata = xr.concat(data, dim='pars')
+
+            return self._unstack_pars(xrdata)
+
+        def _unstack_pars(self, xrdata):
+            """ Unfolds the flat pars dimension of xrdata into one dimension
+                per parameter.
+            """
+            if self.zipargs == {} and isinstance(xrdata, xr.DataArray):
+                # the combinations are enumerated in row major order over the
+                # arrayargs, so the flat pars dimension unstacks by a plain
+                # (view returning, dask compatible) reshape -- no MultiIndex
+                # and no hash based pandas unstack needed. zipped parameters
+                # share one axis and still go through the MultiIndex below.
+                data = xrdata.data.reshape(tuple(self._sizes) + xrdata.data.shape[1:])
+                return xr.DataArray(data,
+                                    dims=tuple(self.arrayargs.keys()) + tuple(xrdata.dims[1:]),
+                                    coords={key: list(values) for key, values in self.arrayargs.items()},
+                                    attrs=self.constargs)
 
             #create a multiindex coordinate for the pars dimension:
-            parvaluesarray = [value for key, value in sorted(self.arrayargsflat.items())]
-            names = ([key for key in sorted(self.arrayargsflat.keys())])
-            #remove the rfname as name and value
-            parvaluesarray.pop(names.index(self.fileargname))
-            names.remove(self.fileargname)
-            mi = MultiIndex.from_arrays(parvaluesarray, names=names)
-            xrdata.coords['pars']=mi
+            xrdata.coords['pars'] = self._pars_multiindex
             return xrdata.unstack('pars')
 
+        @cached_property
+        def _pars_multiindex(self):
+            """ The MultiIndex over all parameter combinations (alphabetical
+                parameter order, rfname excluded), cached since the parameters
+                are fixed after __init__ while retrieves in a notebook tend to
+                be re-run many times.
+            """
+            arrayargsflat = self.arrayargsflat
+            return MultiIndex.from_arrays(
+                        [arrayargsflat[parname] for parname in self._sortedparnames],
+                        names=self._sortedparnames)
 
-        def retrieve_xrdata_ignore_missing(self, verbose=False):
-            allfiles = [(self.localpath+fname.strip('"'))
-                        for fname in self.arrayargsflat[self.fileargname] ]
-            if verbose:
-                    for f in allfiles:
-                            if not  path.exists(f):
-                                    print('ignoreing '+f)
-
-
-            data = [xr.open_dataset(f) for f in allfiles if path.exists(f) ]
 
-            parvaluesarray = [[v for v,f in zip(value, allfiles) if path.exists(f) ] for key, value in sorted(self.arrayargsflat.items())]
-            names = ([key for key in sorted(self.arrayargsflat.keys())])
-            #remove the rfname as name and value
-            parvaluesarray.pop(names.index(self.fileargname))
-            names.remove(self.fileargname)
-            mi = MultiIndex.from_arrays(parvaluesarray, names=names)
+        def retrieve_xrdata_ignore_missing(self, verbose=False, max_workers=None):
+            arrayargsflat = self.arrayargsflat
+            allfiles = [(self.localpath+fname.strip('"'))
+                        for fname in self.rfnames ]
+            if max_workers is None:
+                    max_workers = min(32, len(allfiles)) or 1
+            # both the existence checks and the opens are IO bound (one stat or
+            # open per file on possibly network mounted scratch), so run them
+            # through a thread pool
+            with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                    existing = list(ex.map(path.exists, allfiles))
+                    if verbose:
+                            for f, e in zip(allfiles, existing):
+                                    if not e:
+                                            print('ignoreing '+f)
+
+                    data = list(ex.map(partial(xr.open_dataset, engine=netcdfengine),
+                                       [f for f, e in zip(allfiles, existing) if e]))
+
+            # reuse the existence flags gathered above -- one stat per file,
+            # not one per (parameter, file) pair
+            parvaluesarray = [[v for v,e in zip(arrayargsflat[parname], existing) if e ]
+                                    for parname in self._sortedparnames]
+            mi = MultiIndex.from_arrays(parvaluesarray, names=self._sortedparnames)
             
 #            try:
 #                    xrdata = xr.concat(data, dim='pars')